@@ -10,8 +10,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import CONF_TOKEN_SECRET, DOMAIN
 from .coordinator import TRMNLCoordinator
+from .token_manager import TokenManager
 from .websocket.api import async_setup_websocket_api
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -41,6 +42,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "coordinator": coordinator,
     }
 
+    # Resolve the token manager once so WebSocket handlers get it by key
+    token_secret = entry.data.get(CONF_TOKEN_SECRET)
+    if token_secret:
+        hass.data[DOMAIN][entry.entry_id]["token_manager"] = TokenManager(token_secret)
+
     # Perform initial device refresh
     await coordinator.async_config_entry_first_refresh()
 
@@ -80,10 +80,7 @@ class BaseTRMNLAPI(ABC):
             ConnectionError: If connection to API fails
         """
         devices = await self.get_devices()
-        for device in devices:
-            if device.id == device_id:
-                return device
-        return None
+        return next((device for device in devices if device.id == device_id), None)
 
     @abstractmethod
     async def get_plugin(self, plugin_uuid: str) -> Optional[TRMNLPlugin]:
@@ -2,14 +2,22 @@
 
 import logging
 import asyncio
-from typing import Optional, Any
+import time
+from typing import Any, Awaitable, Iterable, Optional, TypeVar
 from datetime import datetime
 import base64
 
 from aiohttp import ClientSession, ClientError
 
 from .base import BaseTRMNLAPI
-from .models import TRMNLDevice, TRMNLPlugin, MergeVars, DeviceType, DeviceStatus
+from .models import (
+    REPORTED_DEVICE_STATUSES,
+    DeviceStatus,
+    DeviceType,
+    MergeVars,
+    TRMNLDevice,
+    TRMNLPlugin,
+)
 from .exceptions import (
     InvalidServerURLError,
     DeviceDiscoveryError,
@@ -19,6 +27,33 @@ from .exceptions import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Endpoint paths tried in order; probing and fallbacks share these tables
+_DEVICES_PATHS = ("/api/devices", "/devices", "/api/list/devices")
+_PLUGINS_PATH = "/api/custom_plugins"
+# (endpoint key, path) pairs probed during discovery
+_PROBE_ENDPOINTS = (
+    ("devices", "/api/devices"),
+    ("devices", "/devices"),
+    ("plugins", _PLUGINS_PATH),
+)
+_PLUGIN_PATHS = (
+    "/api/plugins/{plugin_uuid}",
+    "/plugins/{plugin_uuid}",
+    _PLUGINS_PATH + "/{plugin_uuid}",
+)
+_PLUGIN_VARIABLES_PATHS = (
+    _PLUGINS_PATH + "/{plugin_uuid}/variables",
+    "/api/plugins/{plugin_uuid}/variables",
+)
+_DEVICE_REFRESH_PATHS = (
+    "/api/devices/{device_id}/refresh",
+    "/devices/{device_id}/refresh",
+)
+# A probe that found nothing is retried after this many seconds
+_EMPTY_PROBE_RETRY_SECONDS = 300
+
 
 class BYOSAPIClient(BaseTRMNLAPI):
     """TRMNL BYOS (Self-Hosted) API client with graceful degradation.
@@ -47,7 +82,11 @@ class BYOSAPIClient(BaseTRMNLAPI):
         self.server_url = server_url.rstrip("/")
         self.auth_type = auth_type
         self.credentials = credentials or {}
-        self._endpoint_cache = {}
+        self._endpoint_cache: Optional[dict[str, str]] = None
+        self._endpoint_probed_at = 0.0
+        # Auth type and credentials are set once above; every request reuses
+        # the headers derived from them
+        self._headers = self._build_headers()
 
     async def validate_credentials(self) -> bool:
         """Validate BYOS server connection and credentials.
@@ -59,7 +98,7 @@ class BYOSAPIClient(BaseTRMNLAPI):
             True if connection successful, False if server unreachable
         """
         session = await self._get_session()
-        headers = self._build_headers()
+        headers = self._headers
 
         # Try to discover endpoints (also validates connection)
         try:
@@ -85,27 +124,25 @@ class BYOSAPIClient(BaseTRMNLAPI):
             DeviceDiscoveryError: Only if server unreachable entirely
         """
         session = await self._get_session()
-        headers = self._build_headers()
+        headers = self._headers
         endpoints = await self._discover_endpoints()
 
         # Try primary endpoint
+        primary_url = None
         if "devices" in endpoints:
-            url = f"{self.server_url}{endpoints['devices']}"
-            devices = await self._try_get_devices(session, headers, url)
+            primary_url = f"{self.server_url}{endpoints['devices']}"
+            devices = await self._try_get_devices(session, headers, primary_url)
             if devices is not None:
                 return devices
 
-        # Try fallback endpoints
-        fallback_urls = [
-            f"{self.server_url}/api/devices",
-            f"{self.server_url}/devices",
-            f"{self.server_url}/api/list/devices",
-        ]
-
-        for url in fallback_urls:
-            devices = await self._try_get_devices(session, headers, url)
-            if devices is not None:
-                return devices
+        # Try fallback endpoints concurrently, preferring them in table order
+        devices = await self._first_available(
+            self._try_get_devices(session, headers, url)
+            for url in (f"{self.server_url}{path}" for path in _DEVICES_PATHS)
+            if url != primary_url
+        )
+        if devices is not None:
+            return devices
 
         _LOGGER.warning("No device endpoints available on BYOS server")
         return []
@@ -122,27 +159,28 @@ class BYOSAPIClient(BaseTRMNLAPI):
             TRMNLPlugin if available, None if endpoint doesn't exist
         """
         session = await self._get_session()
-        headers = self._build_headers()
+        headers = self._headers
         endpoints = await self._discover_endpoints()
 
         # Try primary endpoint
+        primary_url = None
         if "plugins" in endpoints:
-            url = f"{self.server_url}{endpoints['plugins']}/{plugin_uuid}"
-            plugin = await self._try_get_plugin(session, headers, url)
+            primary_url = f"{self.server_url}{endpoints['plugins']}/{plugin_uuid}"
+            plugin = await self._try_get_plugin(session, headers, primary_url)
             if plugin is not None:
                 return plugin
 
-        # Try fallback endpoints
-        fallback_urls = [
-            f"{self.server_url}/api/plugins/{plugin_uuid}",
-            f"{self.server_url}/plugins/{plugin_uuid}",
-            f"{self.server_url}/api/custom_plugins/{plugin_uuid}",
-        ]
-
-        for url in fallback_urls:
-            plugin = await self._try_get_plugin(session, headers, url)
-            if plugin is not None:
-                return plugin
+        # Try fallback endpoints concurrently, preferring them in table order
+        plugin = await self._first_available(
+            self._try_get_plugin(session, headers, url)
+            for url in (
+                f"{self.server_url}{path.format(plugin_uuid=plugin_uuid)}"
+                for path in _PLUGIN_PATHS
+            )
+            if url != primary_url
+        )
+        if plugin is not None:
+            return plugin
 
         _LOGGER.debug("Plugin %s not available on BYOS server", plugin_uuid)
         return None
@@ -164,7 +202,7 @@ class BYOSAPIClient(BaseTRMNLAPI):
             True if update successful, False if endpoint not available
         """
         session = await self._get_session()
-        headers = self._build_headers()
+        headers = self._headers
         endpoints = await self._discover_endpoints()
 
         payload = {
@@ -175,17 +213,17 @@ class BYOSAPIClient(BaseTRMNLAPI):
         # Try primary endpoint
         if "plugins" in endpoints:
             url = f"{self.server_url}{endpoints['plugins']}/{plugin_uuid}/variables"
-            if await self._try_update_variables(session, headers, url, payload):
+            if await self._try_post(
+                session, headers, url, "variables update", payload
+            ):
                 return True
 
         # Try fallback endpoints
-        fallback_urls = [
-            f"{self.server_url}/api/custom_plugins/{plugin_uuid}/variables",
-            f"{self.server_url}/api/plugins/{plugin_uuid}/variables",
-        ]
-
-        for url in fallback_urls:
-            if await self._try_update_variables(session, headers, url, payload):
+        for path in _PLUGIN_VARIABLES_PATHS:
+            url = f"{self.server_url}{path.format(plugin_uuid=plugin_uuid)}"
+            if await self._try_post(
+                session, headers, url, "variables update", payload
+            ):
                 return True
 
         _LOGGER.debug("Plugin variables update not supported on BYOS server")
@@ -204,23 +242,19 @@ class BYOSAPIClient(BaseTRMNLAPI):
             True if triggered, False if not supported
         """
         session = await self._get_session()
-        headers = self._build_headers()
+        headers = self._headers
         endpoints = await self._discover_endpoints()
 
         # Try primary endpoint
         if "devices" in endpoints:
             url = f"{self.server_url}{endpoints['devices']}/{device_id}/refresh"
-            if await self._try_trigger_refresh(session, headers, url):
+            if await self._try_post(session, headers, url, "device refresh"):
                 return True
 
         # Try fallback endpoints
-        fallback_urls = [
-            f"{self.server_url}/api/devices/{device_id}/refresh",
-            f"{self.server_url}/devices/{device_id}/refresh",
-        ]
-
-        for url in fallback_urls:
-            if await self._try_trigger_refresh(session, headers, url):
+        for path in _DEVICE_REFRESH_PATHS:
+            url = f"{self.server_url}{path.format(device_id=device_id)}"
+            if await self._try_post(session, headers, url, "device refresh"):
                 return True
 
         _LOGGER.debug("Device refresh not supported on BYOS server")
@@ -229,41 +263,96 @@ class BYOSAPIClient(BaseTRMNLAPI):
     async def _discover_endpoints(self) -> dict[str, str]:
         """Auto-discover available endpoints on BYOS server.
 
-        Caches successful endpoints for future use.
+        Caches discovered endpoints for future use. An empty result is also
+        cached, but only for a short while, so an unreachable server is not
+        re-probed on every request yet is picked up once it comes back.
 
         Returns:
             Dictionary of available endpoints (may be empty if none found)
         """
-        if self._endpoint_cache:
-            return self._endpoint_cache
+        cache = self._endpoint_cache
+        if cache is not None and (
+            cache
+            or time.monotonic() - self._endpoint_probed_at
+            < _EMPTY_PROBE_RETRY_SECONDS
+        ):
+            return cache
 
         session = await self._get_session()
-        headers = self._build_headers()
-
-        # Try to probe common endpoints to discover server type
-        probe_urls = [
-            f"{self.server_url}/api/devices",
-            f"{self.server_url}/devices",
-            f"{self.server_url}/api/custom_plugins",
-        ]
+        headers = self._headers
+
+        # Probe common endpoints concurrently; results are applied in table
+        # order so the outcome matches probing them one after another
+        responded = await asyncio.gather(
+            *(
+                self._probe_endpoint(session, headers, path)
+                for _, path in _PROBE_ENDPOINTS
+            )
+        )
 
         endpoints = {}
-        for url in probe_urls:
-            try:
-                async with session.head(url, headers=headers, timeout=5) as response:
-                    if response.status in (200, 204, 404):  # Server responds (not 404 doesn't matter for HEAD)
-                        if "/devices" in url:
-                            endpoints["devices"] = url.replace(self.server_url, "")
-                        elif "/custom_plugins" in url or "/plugins" in url:
-                            endpoints["plugins"] = url.replace(self.server_url, "")
-                        _LOGGER.debug("Discovered endpoint: %s", url)
-            except (ClientError, asyncio.TimeoutError):
-                continue
+        for (key, path), ok in zip(_PROBE_ENDPOINTS, responded):
+            if ok:
+                endpoints[key] = path
+                _LOGGER.debug("Discovered endpoint: %s%s", self.server_url, path)
 
         # Cache even if empty (to avoid repeated probing)
         self._endpoint_cache = endpoints
+        self._endpoint_probed_at = time.monotonic()
         return endpoints
 
+    @staticmethod
+    async def _first_available(attempts: Iterable[Awaitable[_T | None]]) -> _T | None:
+        """Run read-only fallback attempts concurrently.
+
+        Results are taken in preference order, so the call returns as soon as
+        the best candidate still pending succeeds; attempts that are no longer
+        needed are cancelled rather than left running.
+
+        Args:
+            attempts: Awaitables that return None when their endpoint is
+                unavailable, in order of preference
+
+        Returns:
+            The first non-None result in preference order, or None
+        """
+        tasks = [asyncio.ensure_future(attempt) for attempt in attempts]
+        try:
+            for task in tasks:
+                result = await task
+                if result is not None:
+                    return result
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Reap the cancelled attempts so none outlive the call
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _probe_endpoint(
+        self,
+        session: ClientSession,
+        headers: dict,
+        path: str,
+    ) -> bool:
+        """Check whether the server answers a HEAD request for a path.
+
+        Args:
+            session: aiohttp ClientSession
+            headers: Request headers with auth
+            path: Endpoint path to probe
+
+        Returns:
+            True if the server responded, False on connection errors
+        """
+        url = f"{self.server_url}{path}"
+        try:
+            async with session.head(url, headers=headers, timeout=5) as response:
+                # Any of these means the server is there (404 is fine for HEAD)
+                return response.status in (200, 204, 404)
+        except (ClientError, asyncio.TimeoutError):
+            return False
+
     async def _try_get_devices(
         self,
         session: ClientSession,
@@ -293,7 +382,7 @@ class BYOSAPIClient(BaseTRMNLAPI):
                 else:
                     _LOGGER.debug("Unexpected status %s fetching devices: %s", response.status, url)
                     return None
-        except (ClientError, ValueError) as err:
+        except (ClientError, asyncio.TimeoutError, ValueError) as err:
             _LOGGER.debug("Error fetching devices from %s: %s", url, err)
             return None
 
@@ -326,18 +415,19 @@ class BYOSAPIClient(BaseTRMNLAPI):
                 else:
                     _LOGGER.debug("Unexpected status %s fetching plugin: %s", response.status, url)
                     return None
-        except (ClientError, ValueError) as err:
+        except (ClientError, asyncio.TimeoutError, ValueError) as err:
             _LOGGER.debug("Error fetching plugin from %s: %s", url, err)
             return None
 
-    async def _try_update_variables(
+    async def _try_post(
         self,
         session: ClientSession,
         headers: dict,
         url: str,
-        payload: dict,
+        action: str,
+        payload: Optional[dict] = None,
     ) -> bool:
-        """Try to update variables at a specific URL.
+        """Try a POST request against a specific URL.
 
         Returns False if endpoint not available (graceful degradation).
 
@@ -345,7 +435,8 @@ class BYOSAPIClient(BaseTRMNLAPI):
             session: aiohttp ClientSession
             headers: Request headers with auth
             url: URL to try
-            payload: Data to send
+            action: Short description of the request, used in log messages
+            payload: Optional JSON body to send
 
         Returns:
             True if successful, False if endpoint not available
@@ -353,49 +444,16 @@ class BYOSAPIClient(BaseTRMNLAPI):
         try:
             async with session.post(url, json=payload, headers=headers, timeout=10) as response:
                 if response.status == 200:
-                    _LOGGER.debug("Successfully updated variables")
-                    return True
-                elif response.status in (404, 405):  # 405 = method not allowed
-                    _LOGGER.debug("Update endpoint not available: %s", url)
-                    return False
-                else:
-                    _LOGGER.debug("Unexpected status %s updating variables: %s", response.status, url)
-                    return False
-        except (ClientError, ValueError) as err:
-            _LOGGER.debug("Error updating variables: %s", err)
-            return False
-
-    async def _try_trigger_refresh(
-        self,
-        session: ClientSession,
-        headers: dict,
-        url: str,
-    ) -> bool:
-        """Try to trigger refresh at a specific URL.
-
-        Returns False if endpoint not available (graceful degradation).
-
-        Args:
-            session: aiohttp ClientSession
-            headers: Request headers with auth
-            url: URL to try
-
-        Returns:
-            True if triggered, False if endpoint not available
-        """
-        try:
-            async with session.post(url, headers=headers, timeout=10) as response:
-                if response.status == 200:
-                    _LOGGER.debug("Successfully triggered refresh")
+                    _LOGGER.debug("Successfully completed %s", action)
                     return True
                 elif response.status in (404, 405):  # 405 = method not allowed
-                    _LOGGER.debug("Refresh endpoint not available: %s", url)
+                    _LOGGER.debug("Endpoint for %s not available: %s", action, url)
                     return False
                 else:
-                    _LOGGER.debug("Unexpected status %s triggering refresh: %s", response.status, url)
+                    _LOGGER.debug("Unexpected status %s for %s: %s", response.status, action, url)
                     return False
         except (ClientError, ValueError) as err:
-            _LOGGER.debug("Error triggering refresh: %s", err)
+            _LOGGER.debug("Error during %s: %s", action, err)
             return False
 
     def _parse_devices_response(self, data: dict[str, Any]) -> list[TRMNLDevice]:
@@ -421,7 +479,7 @@ class BYOSAPIClient(BaseTRMNLAPI):
                 # Infer device status based on presence of data
                 # If API returns the device, it has recently reported data, so consider it online
                 status_str = device_data.get("status", "online")
-                if status_str not in ["online", "offline"]:
+                if status_str not in REPORTED_DEVICE_STATUSES:
                     status_str = "online"  # Default to online if device data was returned
 
                 device = TRMNLDevice(
@@ -484,7 +542,7 @@ class BYOSAPIClient(BaseTRMNLAPI):
         elif self.auth_type == "basic":
             username = self.credentials.get("username", "")
             password = self.credentials.get("password", "")
-            auth_str = base64.b64encode(f"{username}:{password}".encode()).decode()
+            auth_str = base64.b64encode(f"{username}:{password}".encode()).decode("ascii")
             headers["Authorization"] = f"Basic {auth_str}"
 
         return headers
@@ -8,7 +8,14 @@ from aiohttp import ClientSession, ClientError
 
 from ..const import TRMNL_CLOUD_API_BASE, TRMNL_CLOUD_ENDPOINT_DEVICES
 from .base import BaseTRMNLAPI
-from .models import TRMNLDevice, TRMNLPlugin, MergeVars, DeviceType, DeviceStatus
+from .models import (
+    REPORTED_DEVICE_STATUSES,
+    DeviceStatus,
+    DeviceType,
+    MergeVars,
+    TRMNLDevice,
+    TRMNLPlugin,
+)
 from .exceptions import (
     InvalidAPIKeyError,
     DeviceDiscoveryError,
@@ -18,6 +25,16 @@ from .exceptions import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Raw API fields kept on TRMNLDevice.attributes for reference
+_DEVICE_ATTRIBUTE_FIELDS = (
+    "friendly_id",
+    "mac_address",
+    "battery_voltage",
+    "percent_charged",
+    "wifi_strength",
+    "rssi",
+)
+
 
 class CloudAPIClient(BaseTRMNLAPI):
     """TRMNL Cloud API client (usetrmnl.com)."""
@@ -32,6 +49,8 @@ class CloudAPIClient(BaseTRMNLAPI):
         super().__init__(session)
         self.api_key = api_key
         self.base_url = TRMNL_CLOUD_API_BASE
+        # The API key never changes for a client, so its headers are reused
+        self._headers = self._build_headers()
 
     async def validate_credentials(self) -> bool:
         """Validate API credentials.
@@ -46,7 +65,7 @@ class CloudAPIClient(BaseTRMNLAPI):
             TRMNLConnectionError: If connection to API fails
         """
         session = await self._get_session()
-        headers = self._build_headers()
+        headers = self._headers
         url = f"{self.base_url}{TRMNL_CLOUD_ENDPOINT_DEVICES}"
 
         try:
@@ -84,7 +103,7 @@ class CloudAPIClient(BaseTRMNLAPI):
             TRMNLConnectionError: If connection to API fails
         """
         session = await self._get_session()
-        headers = self._build_headers()
+        headers = self._headers
         url = f"{self.base_url}{TRMNL_CLOUD_ENDPOINT_DEVICES}"
 
         try:
@@ -124,7 +143,7 @@ class CloudAPIClient(BaseTRMNLAPI):
             TRMNLConnectionError: If connection to API fails
         """
         session = await self._get_session()
-        headers = self._build_headers()
+        headers = self._headers
         url = f"{self.base_url}/plugins/{plugin_uuid}"
 
         try:
@@ -173,7 +192,7 @@ class CloudAPIClient(BaseTRMNLAPI):
             TRMNLConnectionError: If connection to API fails
         """
         session = await self._get_session()
-        headers = self._build_headers()
+        headers = self._headers
         url = f"{self.base_url}/custom_plugins/{plugin_uuid}/variables"
 
         payload = {
@@ -226,7 +245,7 @@ class CloudAPIClient(BaseTRMNLAPI):
             TRMNLConnectionError: If connection to API fails
         """
         session = await self._get_session()
-        headers = self._build_headers()
+        headers = self._headers
         url = f"{self.base_url}/devices/{device_id}/refresh"
 
         try:
@@ -280,7 +299,7 @@ class CloudAPIClient(BaseTRMNLAPI):
                     # Infer device status based on presence of data
                     # If API returns the device, it has recently reported data, so consider it online
                     status_str = device_data.get("status", "online")
-                    if status_str not in ["online", "offline"]:
+                    if status_str not in REPORTED_DEVICE_STATUSES:
                         status_str = "online"  # Default to online if device data was returned
 
                     device = TRMNLDevice(
@@ -298,12 +317,7 @@ class CloudAPIClient(BaseTRMNLAPI):
                         status=DeviceStatus(status_str),
                         # Include API fields as attributes for reference
                         attributes={
-                            "friendly_id": device_data.get("friendly_id"),
-                            "mac_address": device_data.get("mac_address"),
-                            "battery_voltage": device_data.get("battery_voltage"),
-                            "percent_charged": device_data.get("percent_charged"),
-                            "wifi_strength": device_data.get("wifi_strength"),
-                            "rssi": device_data.get("rssi"),
+                            key: device_data.get(key) for key in _DEVICE_ATTRIBUTE_FIELDS
                         },
                     )
                     devices.append(device)
@@ -21,6 +21,12 @@ class DeviceStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
+# Status strings a server may report verbatim; anything else is treated as online
+REPORTED_DEVICE_STATUSES = frozenset(
+    {DeviceStatus.ONLINE.value, DeviceStatus.OFFLINE.value}
+)
+
+
 @dataclass
 class TRMNLDevice:
     """Represents a TRMNL device."""
@@ -14,7 +14,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .api.models import DeviceStatus
 from .const import DOMAIN
 from .coordinator import TRMNLCoordinator
-from .entities.base import TRMNLEntity
+from .entities.base import TRMNLEntity, build_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,8 +36,9 @@ async def async_setup_entry(
     # Create binary sensor entities for each device
     entities = []
     for device_id, device in coordinator.devices.items():
-        entities.append(TRMNLConnectivityBinarySensor(coordinator, device_id, device))
-        entities.append(TRMNLBatteryLowBinarySensor(coordinator, device_id, device))
+        device_info = build_device_info(device_id, device)
+        entities.append(TRMNLConnectivityBinarySensor(coordinator, device_id, device, device_info))
+        entities.append(TRMNLBatteryLowBinarySensor(coordinator, device_id, device, device_info))
 
     async_add_entities(entities)
 
@@ -47,16 +48,8 @@ class TRMNLConnectivityBinarySensor(TRMNLEntity, BinarySensorEntity):
 
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_icon = "mdi:wifi"
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for sensor."""
-        return f"{self.device_id}_connectivity"
-
-    @property
-    def name(self) -> str:
-        """Return friendly name."""
-        return f"{self.device_name} Connectivity"
+    _unique_id_suffix = "connectivity"
+    _name_suffix = "Connectivity"
 
     @property
     def is_on(self) -> bool | None:
@@ -85,16 +78,8 @@ class TRMNLBatteryLowBinarySensor(TRMNLEntity, BinarySensorEntity):
 
     _attr_device_class = BinarySensorDeviceClass.BATTERY
     _attr_icon = "mdi:battery-low"
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for sensor."""
-        return f"{self.device_id}_battery_low"
-
-    @property
-    def name(self) -> str:
-        """Return friendly name."""
-        return f"{self.device_name} Battery Low"
+    _unique_id_suffix = "battery_low"
+    _name_suffix = "Battery Low"
 
     @property
     def is_on(self) -> bool | None:
@@ -10,7 +10,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import TRMNLCoordinator
-from .entities.base import TRMNLEntity
+from .entities.base import TRMNLEntity, build_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,7 +32,8 @@ async def async_setup_entry(
     # Create button entities for each device
     entities = []
     for device_id, device in coordinator.devices.items():
-        entities.append(TRMNLRefreshButton(coordinator, device_id, device))
+        device_info = build_device_info(device_id, device)
+        entities.append(TRMNLRefreshButton(coordinator, device_id, device, device_info))
 
     async_add_entities(entities)
 
@@ -42,35 +43,26 @@ class TRMNLRefreshButton(TRMNLEntity, ButtonEntity):
 
     _attr_device_class = ButtonDeviceClass.RESTART
     _attr_icon = "mdi:refresh"
-
-    def __init__(self, coordinator: TRMNLCoordinator, device_id: str, device: Any) -> None:
-        """Initialize the button."""
-        super().__init__(coordinator, device_id, device)
-        self._attr_name = f"{self.device_name} Refresh"
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for button."""
-        return f"{self.device_id}_refresh"
-
-    @property
-    def name(self) -> str:
-        """Return friendly name."""
-        return f"{self.device_name} Refresh"
+    _unique_id_suffix = "refresh"
+    _name_suffix = "Refresh"
 
     async def async_press(self) -> None:
         """Handle button press - trigger device refresh."""
         _LOGGER.debug("Triggering refresh for device %s", self.device_id)
 
-        success = await self.coordinator.async_request_refresh(self.device_id)
+        success = await self.coordinator.async_trigger_device_refresh(self.device_id)
 
         if success:
-            _LOGGER.info("Device refresh triggered for %s", self.device_id)
+            _LOGGER.debug("Device refresh triggered for %s", self.device_id)
         else:
             _LOGGER.warning("Device refresh failed for %s", self.device_id)
 
-        # Request coordinator update after refresh
-        await self.coordinator.async_request_refresh()
+        # Poll in the background so the press returns once the device is
+        # triggered; the debounced refresh lets rapid presses share one poll
+        self.hass.async_create_background_task(
+            self.coordinator.async_request_refresh(),
+            f"{DOMAIN}_refresh_after_press_{self.device_id}",
+        )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -15,6 +15,7 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .api import CloudAPIClient, BYOSAPIClient
 from .api.exceptions import InvalidAPIKeyError, DeviceDiscoveryError
 from .const import (
+    AUTH_CREDENTIAL_FIELDS,
     CONF_API_KEY,
     CONF_AUTH_TYPE,
     CONF_DEVICES,
@@ -22,7 +23,6 @@ from .const import (
     CONF_SERVER_TYPE,
     CONF_SERVER_URL,
     CONF_TOKEN_SECRET,
-    CONF_USERNAME,
     AUTH_TYPE_API_KEY,
     AUTH_TYPE_BASIC,
     AUTH_TYPE_NONE,
@@ -34,6 +34,48 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Static step schemas, built once at import rather than on every form render
+SERVER_TYPE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SERVER_TYPE): vol.In(
+            {
+                SERVER_TYPE_CLOUD: "TRMNL Cloud (usetrmnl.com)",
+                SERVER_TYPE_BYOS: "BYOS (Self-hosted)",
+            }
+        ),
+    }
+)
+
+CLOUD_AUTH_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_API_KEY): str,
+    }
+)
+
+BYOS_CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SERVER_URL): str,
+        vol.Required(CONF_AUTH_TYPE): vol.In(
+            {
+                AUTH_TYPE_API_KEY: "API Key",
+                AUTH_TYPE_BASIC: "Basic Auth (Username/Password)",
+                AUTH_TYPE_NONE: "No Authentication",
+            }
+        ),
+    }
+)
+
+# BYOS credential forms, one per auth type, derived from the shared field table
+BYOS_AUTH_SCHEMAS = {
+    auth_type: vol.Schema({vol.Required(key): str for key in fields})
+    for auth_type, fields in AUTH_CREDENTIAL_FIELDS.items()
+}
+
+_EMPTY_SCHEMA = vol.Schema({})
+
+# Entry data keys masked when the entry is logged
+_REDACTED_KEYS = frozenset({CONF_API_KEY, CONF_PASSWORD, CONF_TOKEN_SECRET})
+
 
 class TRMNLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for TRMNL."""
@@ -45,6 +87,7 @@ class TRMNLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         super().__init__()
         self.server_type: str | None = None
         self.server_config: dict[str, Any] = {}
+        self._device_options: dict[str, str] | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -57,20 +100,9 @@ class TRMNLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 return await self.async_step_byos_config()
 
-        server_type_schema = vol.Schema(
-            {
-                vol.Required(CONF_SERVER_TYPE): vol.In(
-                    {
-                        SERVER_TYPE_CLOUD: "TRMNL Cloud (usetrmnl.com)",
-                        SERVER_TYPE_BYOS: "BYOS (Self-hosted)",
-                    }
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=server_type_schema,
+            data_schema=SERVER_TYPE_SCHEMA,
             description_placeholders={},
         )
 
@@ -101,15 +133,9 @@ class TRMNLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.error("Cloud authentication error: %s", err)
                 errors["base"] = "connection_error"
 
-        cloud_auth_schema = vol.Schema(
-            {
-                vol.Required(CONF_API_KEY): str,
-            }
-        )
-
         return self.async_show_form(
             step_id="cloud_auth",
-            data_schema=cloud_auth_schema,
+            data_schema=CLOUD_AUTH_SCHEMA,
             errors=errors,
             description_placeholders={},
         )
@@ -126,22 +152,9 @@ class TRMNLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 auth_type=user_input[CONF_AUTH_TYPE],
             )
 
-        byos_config_schema = vol.Schema(
-            {
-                vol.Required(CONF_SERVER_URL): str,
-                vol.Required(CONF_AUTH_TYPE): vol.In(
-                    {
-                        AUTH_TYPE_API_KEY: "API Key",
-                        AUTH_TYPE_BASIC: "Basic Auth (Username/Password)",
-                        AUTH_TYPE_NONE: "No Authentication",
-                    }
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="byos_config",
-            data_schema=byos_config_schema,
+            data_schema=BYOS_CONFIG_SCHEMA,
             errors=errors,
             description_placeholders={},
         )
@@ -153,13 +166,8 @@ class TRMNLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
-            credentials = {}
-
-            if auth_type == AUTH_TYPE_API_KEY:
-                credentials[CONF_API_KEY] = user_input[CONF_API_KEY]
-            elif auth_type == AUTH_TYPE_BASIC:
-                credentials[CONF_USERNAME] = user_input[CONF_USERNAME]
-                credentials[CONF_PASSWORD] = user_input[CONF_PASSWORD]
+            credential_fields = AUTH_CREDENTIAL_FIELDS.get(auth_type, ())
+            credentials = {key: user_input[key] for key in credential_fields}
 
             try:
                 session = async_get_clientsession(self.hass)
@@ -186,20 +194,9 @@ class TRMNLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.error("BYOS authentication error: %s", err)
                 errors["base"] = "cannot_connect"
 
-        # Build schema based on auth type
-        schema_dict = {}
-
-        if auth_type == AUTH_TYPE_API_KEY:
-            schema_dict[vol.Required(CONF_API_KEY)] = str
-        elif auth_type == AUTH_TYPE_BASIC:
-            schema_dict[vol.Required(CONF_USERNAME)] = str
-            schema_dict[vol.Required(CONF_PASSWORD)] = str
-
-        byos_auth_schema = vol.Schema(schema_dict)
-
         return self.async_show_form(
             step_id="byos_auth",
-            data_schema=byos_auth_schema,
+            data_schema=BYOS_AUTH_SCHEMAS.get(auth_type, _EMPTY_SCHEMA),
             errors=errors,
             description_placeholders={},
         )
@@ -215,46 +212,25 @@ class TRMNLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         server_type = self.server_type or SERVER_TYPE_CLOUD
         server_config = self.server_config or {}
 
-        # Discover devices from API
-        try:
-            session = async_get_clientsession(self.hass)
-
-            if server_type == SERVER_TYPE_CLOUD:
-                api_client = CloudAPIClient(
-                    api_key=server_config[CONF_API_KEY],
-                    session=session,
-                )
-            else:  # BYOS
-                credentials = {}
-                auth_type = server_config.get(CONF_AUTH_TYPE, AUTH_TYPE_NONE)
-
-                if auth_type == AUTH_TYPE_API_KEY:
-                    credentials[CONF_API_KEY] = server_config[CONF_API_KEY]
-                elif auth_type == AUTH_TYPE_BASIC:
-                    credentials[CONF_USERNAME] = server_config.get(CONF_USERNAME, "")
-                    credentials[CONF_PASSWORD] = server_config.get(CONF_PASSWORD, "")
-
-                api_client = BYOSAPIClient(
-                    server_url=server_config[CONF_SERVER_URL],
-                    auth_type=auth_type,
-                    credentials=credentials,
-                    session=session,
+        # Discover devices once; the submitted form is checked against the
+        # options that were shown instead of fetching the device list again
+        if self._device_options is not None:
+            device_options = self._device_options
+        else:
+            try:
+                device_options = await self._async_discover_device_options(
+                    server_type, server_config
                 )
-
-            # Fetch devices
-            devices = await api_client.get_devices()
-
-            if not devices:
-                _LOGGER.warning("No devices discovered from %s", server_type)
-                errors["base"] = "no_devices_found"
+            except Exception as err:
+                _LOGGER.error("Device discovery error: %s", err)
+                errors["base"] = "device_discovery_error"
             else:
-                # Ensure device IDs are strings for proper validation
-                device_options = {str(device.id): device.name for device in devices}
-                _LOGGER.debug("Discovered device options: %s", device_options)
-
-        except Exception as err:
-            _LOGGER.error("Device discovery error: %s", err)
-            errors["base"] = "device_discovery_error"
+                if not device_options:
+                    _LOGGER.warning("No devices discovered from %s", server_type)
+                    errors["base"] = "no_devices_found"
+                else:
+                    self._device_options = device_options
+                    _LOGGER.debug("Discovered device options: %s", device_options)
 
         if user_input is not None:
             selected_devices = user_input.get(CONF_DEVICES, [])
@@ -279,7 +255,15 @@ class TRMNLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_TOKEN_SECRET: token_secret,
                     }
 
-                    _LOGGER.debug("Creating config entry with data: %s", {k: v if k != CONF_API_KEY else "***" for k, v in entry_data.items()})
+                    # Redacted copy is only built when debug logging is on
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "Creating config entry with data: %s",
+                            {
+                                k: "***" if k in _REDACTED_KEYS else v
+                                for k, v in entry_data.items()
+                            },
+                        )
 
                     return self.async_create_entry(
                         title=f"TRMNL ({server_type.upper()})",
@@ -304,3 +288,41 @@ class TRMNLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders={},
         )
+
+    async def _async_discover_device_options(
+        self, server_type: str, server_config: dict[str, Any]
+    ) -> dict[str, str]:
+        """Fetch devices from the configured server.
+
+        Args:
+            server_type: Selected server type (cloud or byos)
+            server_config: Server settings collected by earlier steps
+
+        Returns:
+            Mapping of device ID (as string) to device name
+        """
+        session = async_get_clientsession(self.hass)
+
+        if server_type == SERVER_TYPE_CLOUD:
+            api_client = CloudAPIClient(
+                api_key=server_config[CONF_API_KEY],
+                session=session,
+            )
+        else:  # BYOS
+            auth_type = server_config.get(CONF_AUTH_TYPE, AUTH_TYPE_NONE)
+            credential_fields = AUTH_CREDENTIAL_FIELDS.get(auth_type, ())
+            credentials = {
+                key: server_config.get(key, "") for key in credential_fields
+            }
+
+            api_client = BYOSAPIClient(
+                server_url=server_config[CONF_SERVER_URL],
+                auth_type=auth_type,
+                credentials=credentials,
+                session=session,
+            )
+
+        devices = await api_client.get_devices()
+
+        # Ensure device IDs are strings for proper validation
+        return {str(device.id): device.name for device in devices}
@@ -24,6 +24,12 @@ AUTH_TYPE_API_KEY = "api_key"
 AUTH_TYPE_BASIC = "basic"
 AUTH_TYPE_NONE = "none"
 
+# Credential fields required by each BYOS auth type
+AUTH_CREDENTIAL_FIELDS = {
+    AUTH_TYPE_API_KEY: (CONF_API_KEY,),
+    AUTH_TYPE_BASIC: (CONF_USERNAME, CONF_PASSWORD),
+}
+
 # TRMNL Cloud API
 TRMNL_CLOUD_API_BASE = "https://usetrmnl.com/api"
 TRMNL_CLOUD_ENDPOINT_DEVICES = "/devices"
@@ -1,23 +1,26 @@
 """Data coordinator for TRMNL integration."""
 
+import asyncio
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any, Optional
 
+from aiohttp import ClientError
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import CloudAPIClient, BYOSAPIClient
+from .api.exceptions import TRMNLAPIError
+from .api.models import MergeVars
 from .const import (
+    AUTH_CREDENTIAL_FIELDS,
     CONF_API_KEY,
     CONF_AUTH_TYPE,
     CONF_DEVICES,
-    CONF_PASSWORD,
     CONF_SERVER_TYPE,
     CONF_SERVER_URL,
-    CONF_USERNAME,
     AUTH_TYPE_API_KEY,
-    AUTH_TYPE_BASIC,
     COORDINATOR_UPDATE_INTERVAL,
     DOMAIN,
     SERVER_TYPE_CLOUD,
@@ -46,9 +49,16 @@ class TRMNLCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(minutes=COORDINATOR_UPDATE_INTERVAL),
+            # Device dataclasses compare by value; skip listener updates when
+            # a poll returns exactly what entities already show
+            always_update=False,
         )
 
         self.entry_data = entry_data
+        # Configured IDs are normalized to strings once; API IDs may be ints
+        self._configured_device_ids: frozenset[str] = frozenset(
+            str(cid) for cid in entry_data.get(CONF_DEVICES, [])
+        )
         self.devices: dict[str, Any] = {}
         self.plugins: dict[str, Any] = {}
         self.api_client: CloudAPIClient | BYOSAPIClient | None = None
@@ -67,8 +77,6 @@ class TRMNLCoordinator(DataUpdateCoordinator):
         Returns:
             CloudAPIClient or BYOSAPIClient instance
         """
-        from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
         session = async_get_clientsession(self.hass)
         server_type = self.entry_data.get(CONF_SERVER_TYPE)
 
@@ -78,13 +86,10 @@ class TRMNLCoordinator(DataUpdateCoordinator):
         else:  # BYOS
             server_url = self.entry_data.get(CONF_SERVER_URL)
             auth_type = self.entry_data.get(CONF_AUTH_TYPE, AUTH_TYPE_API_KEY)
-            credentials = {}
-
-            if auth_type == AUTH_TYPE_API_KEY:
-                credentials[CONF_API_KEY] = self.entry_data.get(CONF_API_KEY, "")
-            elif auth_type == AUTH_TYPE_BASIC:
-                credentials[CONF_USERNAME] = self.entry_data.get(CONF_USERNAME, "")
-                credentials[CONF_PASSWORD] = self.entry_data.get(CONF_PASSWORD, "")
+            credential_fields = AUTH_CREDENTIAL_FIELDS.get(auth_type, ())
+            credentials = {
+                key: self.entry_data.get(key, "") for key in credential_fields
+            }
 
             return BYOSAPIClient(
                 server_url=server_url,
@@ -102,51 +107,53 @@ class TRMNLCoordinator(DataUpdateCoordinator):
         Raises:
             UpdateFailed: If update fails
         """
-        try:
-            # Ensure API client is initialized
-            if self.api_client is None:
-                _LOGGER.error("API client is not initialized in coordinator!")
-                raise UpdateFailed("API client not initialized")
+        # Ensure API client is initialized
+        if self.api_client is None:
+            _LOGGER.error("API client is not initialized in coordinator!")
+            raise UpdateFailed("API client not initialized")
 
-            # Fetch all devices
+        # Fetch all devices; only the API call itself is expected to fail.
+        # ValueError covers a malformed JSON body from the server
+        try:
             all_devices = await self.api_client.get_devices()
+        except (TRMNLAPIError, ClientError, asyncio.TimeoutError, ValueError) as err:
+            _LOGGER.error("Error updating TRMNL data: %s", err)
+            raise UpdateFailed(f"Failed to update TRMNL data: {err}") from err
 
-            _LOGGER.debug("Fetched %d devices from API", len(all_devices))
-            for device in all_devices:
-                _LOGGER.debug("Device: id=%s (type: %s), name=%s", device.id, type(device.id).__name__, device.name)
-
-            # Filter to only configured devices
-            configured_device_ids = self.entry_data.get(CONF_DEVICES, [])
-            _LOGGER.debug("Configured device IDs: %s (type: %s)", configured_device_ids, type(configured_device_ids).__name__)
-            if configured_device_ids:
-                _LOGGER.debug("First configured ID: %s (type: %s)", configured_device_ids[0], type(configured_device_ids[0]).__name__)
-
-            # Ensure all device IDs are strings for comparison
-            devices = {
-                device.id: device
-                for device in all_devices
-                if str(device.id) in [str(cid) for cid in configured_device_ids]
-            }
+        # Filter to only configured devices
+        configured_device_ids = self.entry_data.get(CONF_DEVICES, [])
 
-            if not devices:
-                _LOGGER.warning(
-                    "No configured devices found. Expected: %s, Got API devices: %s",
-                    configured_device_ids,
-                    [device.id for device in all_devices],
-                )
+        # Per-device diagnostics are only built when debug logging is on
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Fetched %d devices from API: %s (configured: %s)",
+                len(all_devices),
+                [device.id for device in all_devices],
+                configured_device_ids,
+            )
 
-            # Store devices for entities to access
-            self.devices = devices
+        # Ensure all device IDs are strings for comparison
+        devices = {
+            device.id: device
+            for device in all_devices
+            if str(device.id) in self._configured_device_ids
+        }
+
+        if not devices:
+            _LOGGER.warning(
+                "No configured devices found. Expected: %s, Got API devices: %s",
+                configured_device_ids,
+                [device.id for device in all_devices],
+            )
 
-            _LOGGER.debug("Updated %d devices from API", len(devices))
+        # Store devices for entities to access
+        self.devices = devices
 
-            return {
-                "devices": devices,
-            }
+        _LOGGER.debug("Updated %d devices from API", len(devices))
 
-        except Exception as err:
-            _LOGGER.error("Error updating TRMNL data: %s", err)
-            raise UpdateFailed(f"Failed to update TRMNL data: {err}") from err
+        return {
+            "devices": devices,
+        }
 
     async def get_device(self, device_id: str) -> Optional[Any]:
         """Get a specific device.
@@ -179,8 +186,11 @@ class TRMNLCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Connection validation failed: %s", err)
             return False
 
-    async def async_request_refresh(self, device_id: str) -> bool:
-        """Request immediate device refresh.
+    async def async_trigger_device_refresh(self, device_id: str) -> bool:
+        """Ask the server to refresh a device's display immediately.
+
+        Kept separate from DataUpdateCoordinator.async_request_refresh, which
+        schedules a debounced data poll and must not be shadowed.
 
         Args:
             device_id: Device to refresh
@@ -222,10 +232,6 @@ class TRMNLCoordinator(DataUpdateCoordinator):
         Returns:
             True if update successful
         """
-        from datetime import datetime
-
-        from .api.models import MergeVars
-
         try:
             # If plugin_uuid not provided, try to get from device config
             if not plugin_uuid:
@@ -2,26 +2,88 @@
 
 from typing import Any, Optional
 
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ..api.models import TRMNLDevice
+from ..const import DOMAIN
+
+
+def resolve_device_name(device_id: str, device: Any) -> str:
+    """Return the display name for a TRMNL device.
+
+    Args:
+        device_id: Device ID
+        device: TRMNL device object
+
+    Returns:
+        Device name, or a fallback if the device is not yet loaded
+    """
+    if hasattr(device, 'name'):
+        return device.name
+    return f"Device {device_id}"
+
+
+def build_device_info(device_id: str, device: Any) -> DeviceInfo:
+    """Build device registry information for a TRMNL device.
+
+    Platforms call this once per physical device and share the result
+    across every entity belonging to that device.
+
+    Args:
+        device_id: Device ID
+        device: TRMNL device object
+
+    Returns:
+        DeviceInfo for the device registry
+    """
+    device_type = "unknown"
+    if hasattr(device, 'device_type'):
+        device_type = device.device_type.value
+
+    return DeviceInfo(
+        identifiers={(DOMAIN, device_id)},
+        name=resolve_device_name(device_id, device),
+        manufacturer="TRMNL",
+        model=device_type,
+    )
 
 
 class TRMNLEntity(CoordinatorEntity):
-    """Base class for TRMNL entities."""
+    """Base class for TRMNL entities.
+
+    Subclasses set ``_unique_id_suffix`` and ``_name_suffix``; the unique ID
+    and friendly name are formatted from them once at construction.
+    """
 
-    def __init__(self, coordinator: Any, device_id: str, device: Any) -> None:
+    _unique_id_suffix: str = ""
+    _name_suffix: str = ""
+
+    def __init__(
+        self,
+        coordinator: Any,
+        device_id: str,
+        device: Any,
+        device_info: Optional[DeviceInfo] = None,
+    ) -> None:
         """Initialize the entity.
 
         Args:
             coordinator: Data update coordinator
             device_id: Device ID
             device: TRMNL device object
+            device_info: Shared device info (built from device if omitted)
         """
         super().__init__(coordinator)
         self._device_id = device_id
         self._device = device
+        self._device_name = resolve_device_name(device_id, device)
+        self._attr_device_info = device_info or build_device_info(device_id, device)
+        if self._unique_id_suffix:
+            self._attr_unique_id = f"{device_id}_{self._unique_id_suffix}"
+        if self._name_suffix:
+            self._attr_name = f"{self._device_name} {self._name_suffix}"
 
     @property
     def device_id(self) -> str:
@@ -31,28 +93,9 @@ class TRMNLEntity(CoordinatorEntity):
     @property
     def device_name(self) -> str:
         """Return device name."""
-        if hasattr(self._device, 'name'):
-            return self._device.name
-        # Fallback if device not yet loaded
-        return f"Device {self._device_id}"
+        return self._device_name
 
     @property
     def entity_type(self) -> str:
         """Return entity type (to be overridden by subclasses)."""
         return "unknown"
-
-    @property
-    def device_info(self) -> dict:
-        """Return device information."""
-        device_name = self.device_name
-        device_type = "unknown"
-
-        if hasattr(self._device, 'device_type'):
-            device_type = self._device.device_type.value
-
-        return {
-            "identifiers": {("trmnl", self._device_id)},
-            "name": device_name,
-            "manufacturer": "TRMNL",
-            "model": device_type,
-        }
@@ -16,7 +16,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import TRMNLCoordinator
-from .entities.base import TRMNLEntity
+from .entities.base import TRMNLEntity, build_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,9 +38,10 @@ async def async_setup_entry(
     # Create sensor entities for each device
     entities = []
     for device_id, device in coordinator.devices.items():
-        entities.append(TRMNLBatterySensor(coordinator, device_id, device))
-        entities.append(TRMNLLastSeenSensor(coordinator, device_id, device))
-        entities.append(TRMNLFirmwareVersionSensor(coordinator, device_id, device))
+        device_info = build_device_info(device_id, device)
+        entities.append(TRMNLBatterySensor(coordinator, device_id, device, device_info))
+        entities.append(TRMNLLastSeenSensor(coordinator, device_id, device, device_info))
+        entities.append(TRMNLFirmwareVersionSensor(coordinator, device_id, device, device_info))
 
     async_add_entities(entities)
 
@@ -52,16 +53,8 @@ class TRMNLBatterySensor(TRMNLEntity, SensorEntity):
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:battery"
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for sensor."""
-        return f"{self.device_id}_battery"
-
-    @property
-    def name(self) -> str:
-        """Return friendly name."""
-        return f"{self.device_name} Battery"
+    _unique_id_suffix = "battery"
+    _name_suffix = "Battery"
 
     @property
     def native_value(self) -> int | None:
@@ -89,16 +82,8 @@ class TRMNLLastSeenSensor(TRMNLEntity, SensorEntity):
 
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_icon = "mdi:clock"
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for sensor."""
-        return f"{self.device_id}_last_seen"
-
-    @property
-    def name(self) -> str:
-        """Return friendly name."""
-        return f"{self.device_name} Last Seen"
+    _unique_id_suffix = "last_seen"
+    _name_suffix = "Last Seen"
 
     @property
     def native_value(self) -> str | None:
@@ -125,16 +110,8 @@ class TRMNLFirmwareVersionSensor(TRMNLEntity, SensorEntity):
     """Sensor for TRMNL device firmware version."""
 
     _attr_icon = "mdi:information"
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for sensor."""
-        return f"{self.device_id}_firmware"
-
-    @property
-    def name(self) -> str:
-        """Return friendly name."""
-        return f"{self.device_name} Firmware Version"
+    _unique_id_suffix = "firmware"
+    _name_suffix = "Firmware Version"
 
     @property
     def native_value(self) -> str | None:
@@ -0,0 +1,159 @@
+"""Tests for TRMNL BYOS API client."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from contextlib import asynccontextmanager
+
+from ..api import byos
+from ..api.byos import BYOSAPIClient
+
+pytestmark = pytest.mark.asyncio
+
+SERVER_URL = "http://byos.local:8000"
+
+
+def create_mock_response(status, json_data=None):
+    """Create a mock aiohttp response."""
+    mock_response = MagicMock()
+    mock_response.status = status
+    if json_data is not None:
+        mock_response.json = AsyncMock(return_value=json_data)
+    return mock_response
+
+
+def create_mock_session_get(routes):
+    """Create a mock session.get that answers per URL path.
+
+    Args:
+        routes: Mapping of path to a response, an exception to raise, or an
+            asyncio.Event to wait on before failing
+    """
+    @asynccontextmanager
+    async def context_manager(url, *args, **kwargs):
+        outcome = routes[url[len(SERVER_URL):]]
+        if isinstance(outcome, asyncio.Event):
+            await outcome.wait()
+            raise asyncio.TimeoutError
+        if isinstance(outcome, BaseException):
+            raise outcome
+        yield outcome
+
+    return MagicMock(side_effect=context_manager)
+
+
+class TestBYOSAPIClientFallbacks:
+    """Test BYOSAPIClient fallback endpoint resolution."""
+
+    async def test_get_devices_fallback_succeeds_while_sibling_times_out(self):
+        """Test a successful fallback wins even if a sibling times out or hangs."""
+        client = BYOSAPIClient(server_url=SERVER_URL, auth_type="none")
+        never_answers = asyncio.Event()
+        mock_session = MagicMock()
+        mock_session.get = create_mock_session_get(
+            {
+                "/api/devices": create_mock_response(
+                    200, {"devices": [{"id": "dev", "name": "Kitchen"}]}
+                ),
+                "/devices": asyncio.TimeoutError(),
+                "/api/list/devices": never_answers,
+            }
+        )
+        client.session = mock_session
+
+        with patch.object(client, "_discover_endpoints", AsyncMock(return_value={})):
+            devices = await asyncio.wait_for(client.get_devices(), timeout=1)
+
+        assert [device.id for device in devices] == ["dev"]
+        assert mock_session.get.call_count == 3
+
+    async def test_get_devices_all_fallbacks_time_out(self):
+        """Test get_devices degrades to an empty list when every fallback times out."""
+        client = BYOSAPIClient(server_url=SERVER_URL, auth_type="none")
+        mock_session = MagicMock()
+        mock_session.get = create_mock_session_get(
+            {
+                "/api/devices": asyncio.TimeoutError(),
+                "/devices": asyncio.TimeoutError(),
+                "/api/list/devices": asyncio.TimeoutError(),
+            }
+        )
+        client.session = mock_session
+
+        with patch.object(client, "_discover_endpoints", AsyncMock(return_value={})):
+            devices = await client.get_devices()
+
+        assert devices == []
+
+    async def test_first_available_cancels_remaining_attempts(self):
+        """Test attempts still pending after a preferred success are cancelled."""
+        slow = asyncio.ensure_future(asyncio.sleep(10))
+
+        async def preferred():
+            return "preferred"
+
+        result = await BYOSAPIClient._first_available([preferred(), slow])
+
+        assert result == "preferred"
+        assert slow.cancelled()
+
+
+class TestBYOSAPIClientEndpointDiscovery:
+    """Test BYOSAPIClient endpoint discovery caching."""
+
+    @staticmethod
+    def _client_with_probe(responds):
+        """Create a client whose endpoint probes all answer with responds."""
+        client = BYOSAPIClient(server_url=SERVER_URL, auth_type="none")
+        client.session = MagicMock()
+        client._probe_endpoint = AsyncMock(return_value=responds)
+        return client
+
+    async def test_empty_result_cached_within_ttl(self):
+        """Test an empty discovery result is reused until the retry window passes."""
+        client = self._client_with_probe(False)
+        mock_time = MagicMock()
+
+        with patch.object(byos, "time", mock_time):
+            mock_time.monotonic.return_value = 1000.0
+            assert await client._discover_endpoints() == {}
+            probes = client._probe_endpoint.await_count
+
+            mock_time.monotonic.return_value = 1000.0 + byos._EMPTY_PROBE_RETRY_SECONDS - 1
+            assert await client._discover_endpoints() == {}
+
+        assert client._endpoint_cache == {}
+        assert client._probe_endpoint.await_count == probes
+
+    async def test_empty_result_reprobed_after_ttl(self):
+        """Test an empty discovery result is probed again once the TTL expires."""
+        client = self._client_with_probe(False)
+        mock_time = MagicMock()
+
+        with patch.object(byos, "time", mock_time):
+            mock_time.monotonic.return_value = 1000.0
+            assert await client._discover_endpoints() == {}
+            probes = client._probe_endpoint.await_count
+
+            client._probe_endpoint.return_value = True
+            mock_time.monotonic.return_value = 1000.0 + byos._EMPTY_PROBE_RETRY_SECONDS
+            endpoints = await client._discover_endpoints()
+
+        assert endpoints["plugins"] == byos._PLUGINS_PATH
+        assert client._probe_endpoint.await_count == 2 * probes
+
+    async def test_non_empty_result_cached_permanently(self):
+        """Test a non-empty discovery result is never probed again."""
+        client = self._client_with_probe(True)
+        mock_time = MagicMock()
+
+        with patch.object(byos, "time", mock_time):
+            mock_time.monotonic.return_value = 1000.0
+            endpoints = await client._discover_endpoints()
+            probes = client._probe_endpoint.await_count
+
+            mock_time.monotonic.return_value = 1000.0 + 100 * byos._EMPTY_PROBE_RETRY_SECONDS
+            assert await client._discover_endpoints() is endpoints
+
+        assert endpoints
+        assert client._probe_endpoint.await_count == probes
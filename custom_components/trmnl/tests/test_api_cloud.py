@@ -512,6 +512,24 @@ class TestCloudAPIClientHeaders:
 
         assert headers["Authorization"] == f"Bearer {api_key}"
 
+    async def test_headers_built_once(self):
+        """Test that request headers are built at init and reused."""
+        client = CloudAPIClient(api_key="test_api_key_123")
+
+        mock_response = create_mock_response(200, {"devices": []})
+        mock_session = MagicMock()
+        mock_session.get = create_mock_session_method(mock_response)
+        client.session = mock_session
+
+        with patch.object(client, "_build_headers") as mock_build_headers:
+            await client.validate_credentials()
+            await client.get_devices()
+
+        mock_build_headers.assert_not_called()
+        assert mock_session.get.call_count == 2
+        for call in mock_session.get.call_args_list:
+            assert call.kwargs["headers"] == client._headers
+
 
 class TestCloudAPIClientContextManager:
     """Test CloudAPIClient context manager support."""
@@ -27,11 +27,19 @@ def mock_coordinator() -> MagicMock:
     )
 
     coordinator.devices = {"device_1": device}
-    coordinator.async_request_refresh = AsyncMock(return_value=True)
+    coordinator.async_trigger_device_refresh = AsyncMock(return_value=True)
+    coordinator.async_request_refresh = AsyncMock()
 
     return coordinator
 
 
+def _mock_hass() -> MagicMock:
+    """Create a hass mock that discards scheduled background coroutines."""
+    hass = MagicMock(spec=HomeAssistant)
+    hass.async_create_background_task.side_effect = lambda coro, name: coro.close()
+    return hass
+
+
 class TestRefreshButton:
     """Test TRMNL refresh button."""
 
@@ -71,26 +79,32 @@ class TestRefreshButton:
         button = TRMNLRefreshButton(
             mock_coordinator, "device_1", mock_coordinator.devices["device_1"]
         )
+        button.hass = _mock_hass()
 
         await button.async_press()
 
-        # Verify coordinator refresh was called
-        assert mock_coordinator.async_request_refresh.call_count == 2
-        # First call with device_id, second without (for coordinator update)
+        # Device refresh is triggered, then a coordinator update is scheduled
+        mock_coordinator.async_trigger_device_refresh.assert_awaited_once_with(
+            "device_1"
+        )
+        mock_coordinator.async_request_refresh.assert_called_once_with()
+        button.hass.async_create_background_task.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_refresh_button_press_failure(
         self, mock_coordinator: MagicMock
     ) -> None:
         """Test refresh button press handles failure."""
-        mock_coordinator.async_request_refresh = AsyncMock(return_value=False)
+        mock_coordinator.async_trigger_device_refresh = AsyncMock(return_value=False)
         button = TRMNLRefreshButton(
             mock_coordinator, "device_1", mock_coordinator.devices["device_1"]
         )
+        button.hass = _mock_hass()
 
         # Should not raise exception on failure
         await button.async_press()
 
+        assert mock_coordinator.async_trigger_device_refresh.called
         assert mock_coordinator.async_request_refresh.called
 
     def test_refresh_button_extra_attributes(
@@ -7,7 +7,7 @@ from homeassistant.core import HomeAssistant
 
 from ..api.exceptions import InvalidAPIKeyError
 from ..api.models import TRMNLDevice, DeviceStatus, DeviceType
-from ..config_flow import TRMNLConfigFlow
+from ..config_flow import BYOS_AUTH_SCHEMAS, TRMNLConfigFlow
 from ..const import (
     CONF_API_KEY,
     CONF_DEVICES,
@@ -127,6 +127,15 @@ class TestConfigFlowBYOSStep:
         assert AUTH_TYPE_BASIC in auth_types
         assert AUTH_TYPE_NONE in auth_types
 
+    def test_byos_auth_schemas_match_auth_type(self) -> None:
+        """Test that each BYOS auth type gets a form with its credential fields."""
+        api_key_fields = {str(key) for key in BYOS_AUTH_SCHEMAS[AUTH_TYPE_API_KEY].schema}
+        basic_fields = {str(key) for key in BYOS_AUTH_SCHEMAS[AUTH_TYPE_BASIC].schema}
+
+        assert api_key_fields == {CONF_API_KEY}
+        assert basic_fields == {CONF_USERNAME, CONF_PASSWORD}
+        assert AUTH_TYPE_NONE not in BYOS_AUTH_SCHEMAS
+
     def test_byos_api_key_auth(self) -> None:
         """Test BYOS with API key authentication."""
         config = {
@@ -223,6 +232,99 @@ class TestConfigFlowDeviceDiscovery:
         assert all(device_id in config[CONF_DEVICES] for device_id in selected_devices)
 
 
+DEVICE_OPTIONS = {"device_1": "Living Room (og)", "device_2": "Bedroom (x)"}
+
+
+@pytest.fixture
+def discovery_flow() -> TRMNLConfigFlow:
+    """Create a config flow positioned at the device discovery step."""
+    flow = TRMNLConfigFlow()
+    flow.hass = MagicMock(spec=HomeAssistant)
+    flow.server_type = SERVER_TYPE_CLOUD
+    flow.server_config = {CONF_API_KEY: "test_api_key"}
+    flow.async_show_form = MagicMock(return_value={"type": "form"})
+    flow.async_create_entry = MagicMock(return_value={"type": "create_entry"})
+    return flow
+
+
+def _form_errors(flow: TRMNLConfigFlow) -> dict[str, str]:
+    """Return the errors passed to the most recently shown form."""
+    return flow.async_show_form.call_args.kwargs["errors"]
+
+
+class TestConfigFlowDeviceDiscoveryStep:
+    """Test the device discovery step of the config flow."""
+
+    @pytest.mark.asyncio
+    async def test_discovers_once_for_show_and_submit(
+        self, discovery_flow: TRMNLConfigFlow
+    ) -> None:
+        """Test devices are fetched once when the form is shown and submitted."""
+        with patch.object(
+            discovery_flow,
+            "_async_discover_device_options",
+            AsyncMock(return_value=DEVICE_OPTIONS),
+        ) as mock_discover:
+            await discovery_flow.async_step_device_discovery()
+            assert _form_errors(discovery_flow) == {}
+
+            result = await discovery_flow.async_step_device_discovery(
+                {CONF_DEVICES: ["device_1"]}
+            )
+
+        assert result == {"type": "create_entry"}
+        mock_discover.assert_awaited_once()
+        entry_data = discovery_flow.async_create_entry.call_args.kwargs["data"]
+        assert entry_data[CONF_DEVICES] == ["device_1"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("first_result", "error"),
+        [
+            (RuntimeError("server unreachable"), "device_discovery_error"),
+            ({}, "no_devices_found"),
+        ],
+    )
+    async def test_failed_discovery_is_not_cached(
+        self,
+        discovery_flow: TRMNLConfigFlow,
+        first_result: Exception | dict[str, str],
+        error: str,
+    ) -> None:
+        """Test a failed or empty discovery shows an error and is retried."""
+        with patch.object(
+            discovery_flow,
+            "_async_discover_device_options",
+            AsyncMock(side_effect=[first_result, DEVICE_OPTIONS]),
+        ) as mock_discover:
+            await discovery_flow.async_step_device_discovery()
+            assert _form_errors(discovery_flow) == {"base": error}
+
+            await discovery_flow.async_step_device_discovery()
+            assert _form_errors(discovery_flow) == {}
+
+        assert mock_discover.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_selection_outside_cached_options_rejected(
+        self, discovery_flow: TRMNLConfigFlow
+    ) -> None:
+        """Test a submitted device that was not offered is rejected."""
+        with patch.object(
+            discovery_flow,
+            "_async_discover_device_options",
+            AsyncMock(return_value=DEVICE_OPTIONS),
+        ) as mock_discover:
+            await discovery_flow.async_step_device_discovery()
+            await discovery_flow.async_step_device_discovery(
+                {CONF_DEVICES: ["device_1", "device_3"]}
+            )
+
+        assert _form_errors(discovery_flow) == {CONF_DEVICES: "invalid_devices"}
+        mock_discover.assert_awaited_once()
+        discovery_flow.async_create_entry.assert_not_called()
+
+
 class TestConfigFlowValidation:
     """Test config flow validation."""
 
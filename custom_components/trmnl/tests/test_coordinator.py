@@ -1,12 +1,17 @@
 """Tests for data coordinator."""
 
+import asyncio
+import json
+from dataclasses import replace
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from aiohttp import ClientError
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from ..api.exceptions import TRMNLAPIError
 from ..api.models import TRMNLDevice, DeviceStatus, DeviceType
 from ..const import (
     CONF_API_KEY,
@@ -71,6 +76,34 @@ class TestCoordinatorInitialization:
         assert coordinator.devices == {}
         assert coordinator.plugins == {}
 
+    @pytest.mark.asyncio
+    async def test_coordinator_skips_unchanged_updates(
+        self, sample_devices: list[TRMNLDevice]
+    ) -> None:
+        """Test coordinator only notifies entities when data changes."""
+        coordinator = TRMNLCoordinator(MagicMock(), {CONF_DEVICES: ["device_1"]})
+        coordinator.api_client = MagicMock()
+        coordinator.api_client.get_devices = AsyncMock(
+            side_effect=[
+                [sample_devices[0]],
+                # Equal by value but a new object, as a fresh poll returns
+                [replace(sample_devices[0])],
+                [replace(sample_devices[0], battery_level=80)],
+            ]
+        )
+        listener = MagicMock()
+        coordinator.async_add_listener(listener)
+
+        await coordinator.async_refresh()
+        listener.reset_mock()
+
+        await coordinator.async_refresh()
+        listener.assert_not_called()
+
+        await coordinator.async_refresh()
+        listener.assert_called_once()
+        assert coordinator.data["devices"]["device_1"].battery_level == 80
+
     def test_coordinator_device_storage(self) -> None:
         """Test coordinator device storage initialization."""
         coordinator = MagicMock(spec=TRMNLCoordinator)
@@ -124,6 +157,55 @@ class TestCoordinatorDataUpdate:
         assert all(device_id in coordinator.devices for device_id in ["device_1", "device_2"])
 
 
+def _make_coordinator() -> TRMNLCoordinator:
+    """Create a real coordinator without running DataUpdateCoordinator setup."""
+    with patch.object(DataUpdateCoordinator, "__init__", return_value=None):
+        return TRMNLCoordinator(MagicMock(spec=HomeAssistant), {CONF_DEVICES: ["device_1"]})
+
+
+class TestCoordinatorUpdateErrors:
+    """Test coordinator error handling during updates."""
+
+    @pytest.mark.asyncio
+    async def test_update_without_api_client_fails(self) -> None:
+        """Test update raises UpdateFailed before the API client exists."""
+        coordinator = _make_coordinator()
+
+        with pytest.raises(UpdateFailed, match="not initialized"):
+            await coordinator._async_update_data()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            TRMNLAPIError("server error"),
+            ClientError("connection reset"),
+            asyncio.TimeoutError(),
+            json.JSONDecodeError("Expecting value", "<html>", 0),
+        ],
+    )
+    async def test_update_wraps_api_errors(self, error: Exception) -> None:
+        """Test expected API failures are reported as UpdateFailed."""
+        coordinator = _make_coordinator()
+        coordinator.api_client = MagicMock()
+        coordinator.api_client.get_devices = AsyncMock(side_effect=error)
+
+        with pytest.raises(UpdateFailed) as exc_info:
+            await coordinator._async_update_data()
+
+        assert exc_info.value.__cause__ is error
+
+    @pytest.mark.asyncio
+    async def test_update_propagates_unexpected_errors(self) -> None:
+        """Test programming errors are not masked as UpdateFailed."""
+        coordinator = _make_coordinator()
+        coordinator.api_client = MagicMock()
+        coordinator.api_client.get_devices = AsyncMock(side_effect=KeyError("id"))
+
+        with pytest.raises(KeyError):
+            await coordinator._async_update_data()
+
+
 class TestCoordinatorGetDevices:
     """Test coordinator device getter methods."""
 
@@ -188,6 +270,14 @@ class TestCoordinatorRefresh:
         assert hasattr(coordinator, "async_request_refresh")
         assert callable(coordinator.async_request_refresh)
 
+    def test_coordinator_device_refresh_does_not_shadow_poll(self) -> None:
+        """Test that device refresh keeps the base debounced refresh intact."""
+        assert (
+            TRMNLCoordinator.async_request_refresh
+            is DataUpdateCoordinator.async_request_refresh
+        )
+        assert callable(TRMNLCoordinator.async_trigger_device_refresh)
+
 
 class TestCoordinatorScreenshot:
     """Test coordinator screenshot update."""
@@ -7,6 +7,7 @@ import pytest
 from homeassistant.core import HomeAssistant
 
 from ..api.models import TRMNLDevice, DeviceStatus, DeviceType
+from ..entities.base import build_device_info
 from ..sensor import (
     TRMNLBatterySensor,
     TRMNLLastSeenSensor,
@@ -180,3 +181,18 @@ class TestSensorSetup:
 
         # All sensors should be properly created
         assert all([battery_sensor, last_seen_sensor, firmware_sensor])
+
+    def test_sensors_share_device_info(self, mock_coordinator: MagicMock) -> None:
+        """Test that sensors of one device share a single DeviceInfo."""
+        device = mock_coordinator.devices["device_1"]
+        device_info = build_device_info("device_1", device)
+
+        battery_sensor = TRMNLBatterySensor(mock_coordinator, "device_1", device, device_info)
+        firmware_sensor = TRMNLFirmwareVersionSensor(
+            mock_coordinator, "device_1", device, device_info
+        )
+
+        assert battery_sensor.device_info is firmware_sensor.device_info
+        assert device_info["identifiers"] == {("trmnl", "device_1")}
+        assert device_info["name"] == "Living Room"
+        assert device_info["model"] == "og"
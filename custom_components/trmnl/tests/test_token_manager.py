@@ -10,7 +10,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from ..api.exceptions import InvalidTokenError
-from ..token_manager import TokenManager
+from ..token_manager import TokenManager, _decode_payload
 
 
 class TestTokenManagerInitialization:
@@ -330,6 +330,17 @@ class TestTokenInfo:
         assert "expires_at" in info
         assert len(info) == 3
 
+    def test_token_payload_decoded_once(self, manager: TokenManager) -> None:
+        """Test that repeated reads of one token reuse the decoded payload."""
+        token = manager.generate_token("device_1")
+        manager.validate_token(token)
+        hits_before = _decode_payload.cache_info().hits
+
+        info = manager.get_token_info(token)
+
+        assert info["device_id"] == "device_1"
+        assert _decode_payload.cache_info().hits == hits_before + 1
+
     def test_get_token_info_invalid_format(self, manager: TokenManager) -> None:
         """Test getting info from invalidly formatted token."""
         with pytest.raises(InvalidTokenError, match="Invalid token format"):
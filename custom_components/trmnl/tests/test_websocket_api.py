@@ -1,16 +1,17 @@
 """Tests for WebSocket API."""
 
 from datetime import datetime, timedelta, timezone
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import Unauthorized
 from homeassistant.components.websocket_api import ActiveConnection, websocket_command
 
 from ..api.exceptions import InvalidTokenError
 from ..api.models import TRMNLDevice, DeviceStatus, DeviceType
 from ..const import (
-    CONF_TOKEN_SECRET,
     DOMAIN,
     WS_TYPE_GENERATE_TOKEN,
     WS_TYPE_GET_DEVICES,
@@ -18,7 +19,9 @@ from ..const import (
 )
 from ..coordinator import TRMNLCoordinator
 from ..token_manager import TokenManager
+from ..websocket import api as websocket_api
 from ..websocket.api import (
+    async_setup_websocket_api,
     handle_generate_token,
     handle_get_devices,
     handle_update_screenshot,
@@ -57,24 +60,16 @@ def mock_hass(mock_coordinator: MagicMock) -> MagicMock:
     entry_id = "test_entry"
     token_secret = "test_secret_1234567890abcdef"
 
+    # Mirrors what entry setup stores for an entry with a token secret
     hass.data = {
         DOMAIN: {
             entry_id: {
                 "coordinator": mock_coordinator,
+                "token_manager": TokenManager(token_secret),
             }
         }
     }
 
-    # Mock config entry
-    mock_config_entry = MagicMock()
-    mock_config_entry.data = {
-        CONF_TOKEN_SECRET: token_secret,
-    }
-
-    hass.config_entries.async_get_entry = MagicMock(
-        return_value=mock_config_entry
-    )
-
     return hass
 
 
@@ -246,6 +241,27 @@ class TestHandleGenerateToken:
         # Verify error
         assert mock_connection.send_error.called
 
+    @pytest.mark.asyncio
+    async def test_generate_token_without_token_secret(
+        self, mock_hass: MagicMock, mock_connection: MagicMock
+    ) -> None:
+        """Test generate_token for an entry set up without a token secret."""
+        del mock_hass.data[DOMAIN]["test_entry"]["token_manager"]
+        msg = {
+            "id": 124,
+            "type": WS_TYPE_GENERATE_TOKEN,
+            "entry_id": "test_entry",
+            "device_id": "device_1",
+        }
+
+        await handle_generate_token(mock_hass, mock_connection, msg)
+
+        # Verify error
+        mock_connection.send_error.assert_called_once_with(
+            124, "internal_error", "No token manager for this entry"
+        )
+        mock_connection.send_result.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_generate_token_format(
         self, mock_hass: MagicMock, mock_connection: MagicMock
@@ -465,3 +481,71 @@ class TestWebSocketIntegration:
         device_ids = [d["id"] for d in result["devices"]]
         assert "device_1" in device_ids
         assert "device_2" in device_ids
+
+
+class TestWebSocketSetup:
+    """Test WebSocket command registration."""
+
+    def test_setup_registers_all_commands(self, mock_hass: MagicMock) -> None:
+        """Test that every command in the table is registered."""
+        with patch.object(websocket_api, "async_register_command") as mock_register:
+            async_setup_websocket_api(mock_hass)
+
+        registered = [call.args[1] for call in mock_register.call_args_list]
+        assert registered == list(websocket_api._WS_COMMANDS)
+        assert {command._ws_command for command in registered} == {
+            WS_TYPE_GET_DEVICES,
+            WS_TYPE_GENERATE_TOKEN,
+            WS_TYPE_UPDATE_SCREENSHOT,
+        }
+
+    def test_setup_registers_commands_once(self, mock_hass: MagicMock) -> None:
+        """Test that setting up a second entry does not re-register commands."""
+        with patch.object(websocket_api, "async_register_command") as mock_register:
+            async_setup_websocket_api(mock_hass)
+            async_setup_websocket_api(mock_hass)
+
+        assert mock_register.call_count == len(websocket_api._WS_COMMANDS)
+
+
+class TestWebSocketAdminCommands:
+    """Test that sensitive WebSocket commands require an admin user."""
+
+    @pytest.mark.parametrize(
+        ("command", "handler", "msg"),
+        [
+            (
+                websocket_api.websocket_get_devices,
+                "handle_get_devices",
+                {"id": 126, "type": WS_TYPE_GET_DEVICES, "entry_id": "test_entry"},
+            ),
+            (
+                websocket_api.websocket_generate_token,
+                "handle_generate_token",
+                {
+                    "id": 127,
+                    "type": WS_TYPE_GENERATE_TOKEN,
+                    "entry_id": "test_entry",
+                    "device_id": "device_1",
+                },
+            ),
+        ],
+    )
+    def test_non_admin_rejected(
+        self,
+        mock_hass: MagicMock,
+        mock_connection: MagicMock,
+        command: Any,
+        handler: str,
+        msg: dict[str, Any],
+    ) -> None:
+        """Test a non-admin connection cannot list devices or create tokens."""
+        mock_connection.user = MagicMock(is_admin=False)
+
+        with patch.object(websocket_api, handler) as mock_handler:
+            with pytest.raises(Unauthorized):
+                command(mock_hass, mock_connection, msg)
+
+        mock_handler.assert_not_called()
+        mock_hass.async_create_background_task.assert_not_called()
+        mock_connection.send_result.assert_not_called()
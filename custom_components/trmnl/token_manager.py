@@ -6,7 +6,8 @@ import hmac
 import json
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 from .api.exceptions import InvalidTokenError
 from .const import (
@@ -20,9 +21,34 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _decode_payload(payload_b64: str) -> dict[str, Any]:
+    """Decode a token payload.
+
+    A token is typically read several times (validation, device check,
+    rotation check), so decoded payloads are cached. Callers must treat the
+    returned dict as read-only.
+
+    Args:
+        payload_b64: Base64-encoded JSON payload
+
+    Returns:
+        Decoded payload data
+    """
+    # json.loads reads the UTF-8 bytes directly, skipping a str copy
+    return json.loads(base64.b64decode(payload_b64))
+
+
 class TokenManager:
     """Manager for generating and validating HMAC-signed tokens."""
 
+    __slots__ = (
+        "_token_secret",
+        "_hmac_template",
+        "_token_ttl_hours",
+        "_rotation_threshold_hours",
+    )
+
     def __init__(self, token_secret: str) -> None:
         """Initialize token manager.
 
@@ -36,6 +62,10 @@ class TokenManager:
             raise ValueError("token_secret must be a non-empty string")
 
         self._token_secret = token_secret
+        # Keyed once here; each signature copies it instead of re-keying
+        self._hmac_template = hmac.new(
+            token_secret.encode(), digestmod=hashlib.sha256
+        )
         self._token_ttl_hours = TOKEN_TTL_HOURS
         self._rotation_threshold_hours = TOKEN_ROTATION_THRESHOLD_HOURS
 
@@ -68,7 +98,7 @@ class TokenManager:
 
         # Encode payload as base64
         payload_json = json.dumps(payload_data)
-        payload_b64 = base64.b64encode(payload_json.encode()).decode()
+        payload_b64 = base64.b64encode(payload_json.encode()).decode("ascii")
 
         # Generate HMAC signature
         signature = self._generate_signature(payload_b64)
@@ -112,8 +142,7 @@ class TokenManager:
                 raise InvalidTokenError("Invalid token signature")
 
             # Decode and parse payload
-            payload_json = base64.b64decode(payload_b64).decode()
-            payload_data = json.loads(payload_json)
+            payload_data = _decode_payload(payload_b64)
 
             # Check expiration
             expires_at = datetime.fromisoformat(payload_data["expires_at"])
@@ -151,8 +180,7 @@ class TokenManager:
             _, payload_b64, _ = parts
 
             # Decode and parse payload
-            payload_json = base64.b64decode(payload_b64).decode()
-            payload_data = json.loads(payload_json)
+            payload_data = _decode_payload(payload_b64)
 
             # Check if expiration is within rotation threshold
             expires_at = datetime.fromisoformat(payload_data["expires_at"])
@@ -197,8 +225,7 @@ class TokenManager:
             _, payload_b64, _ = parts
 
             # Decode and parse payload
-            payload_json = base64.b64decode(payload_b64).decode()
-            payload_data = json.loads(payload_json)
+            payload_data = _decode_payload(payload_b64)
 
             return {
                 "device_id": payload_data.get("device_id"),
@@ -218,9 +245,6 @@ class TokenManager:
         Returns:
             Hex-encoded signature
         """
-        signature = hmac.new(
-            self._token_secret.encode(),
-            payload.encode(),
-            hashlib.sha256,
-        ).hexdigest()
-        return signature
+        mac = self._hmac_template.copy()
+        mac.update(payload.encode())
+        return mac.hexdigest()
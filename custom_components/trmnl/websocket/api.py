@@ -3,18 +3,20 @@
 import logging
 from typing import Any, Callable
 
+import voluptuous as vol
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.components.websocket_api import (
     ERR_INVALID_FORMAT,
     ERR_UNAUTHORIZED,
     ActiveConnection,
+    async_register_command,
     async_response,
+    require_admin,
     websocket_command,
 )
 
 from ..api.exceptions import InvalidTokenError, TRMNLAPIError
 from ..const import (
-    CONF_TOKEN_SECRET,
     DOMAIN,
     WS_TYPE_GENERATE_TOKEN,
     WS_TYPE_GET_DEVICES,
@@ -25,43 +27,91 @@ from ..token_manager import TokenManager
 
 _LOGGER = logging.getLogger(__name__)
 
+# hass.data flag marking the commands as registered; kept outside
+# hass.data[DOMAIN], which is keyed by config entry ID
+_DATA_WS_REGISTERED = f"{DOMAIN}_websocket_registered"
 
+
+@require_admin
+@websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_GET_DEVICES,
+        vol.Required("entry_id"): str,
+    }
+)
+@async_response
+async def websocket_get_devices(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """WebSocket command handler for get_devices."""
+    await handle_get_devices(hass, connection, msg)
+
+
+@require_admin
+@websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_GENERATE_TOKEN,
+        vol.Required("entry_id"): str,
+        vol.Required("device_id"): str,
+    }
+)
+@async_response
+async def websocket_generate_token(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """WebSocket command handler for generate_token."""
+    await handle_generate_token(hass, connection, msg)
+
+
+@websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_UPDATE_SCREENSHOT,
+        vol.Required("entry_id"): str,
+        vol.Required("device_id"): str,
+        vol.Required("image_url"): str,
+        vol.Required("token"): str,
+    }
+)
+@async_response
+async def websocket_update_screenshot(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """WebSocket command handler for update_screenshot."""
+    await handle_update_screenshot(hass, connection, msg)
+
+
+# Commands registered with Home Assistant, built once at import. Listing
+# devices and minting image tokens is limited to admins; update_screenshot
+# is authorized by the signed token it carries
+_WS_COMMANDS: tuple[Callable[..., Any], ...] = (
+    websocket_get_devices,
+    websocket_generate_token,
+    websocket_update_screenshot,
+)
+
+
+@callback
 def async_setup_websocket_api(hass: HomeAssistant) -> None:
     """Set up WebSocket API for TRMNL integration.
 
+    Commands are registered once per Home Assistant instance; later config
+    entries reuse the existing registration.
+
     Args:
         hass: Home Assistant instance
     """
+    if hass.data.get(_DATA_WS_REGISTERED):
+        return
+    hass.data[_DATA_WS_REGISTERED] = True
 
-    @websocket_command({"type": WS_TYPE_GET_DEVICES})
-    @async_response
-    async def handle_get_devices_impl(
-        hass_inner: HomeAssistant,
-        connection: ActiveConnection,
-        msg: dict[str, Any],
-    ) -> None:
-        """WebSocket command handler for get_devices."""
-        await handle_get_devices(hass_inner, connection, msg)
-
-    @websocket_command({"type": WS_TYPE_GENERATE_TOKEN})
-    @async_response
-    async def handle_generate_token_impl(
-        hass_inner: HomeAssistant,
-        connection: ActiveConnection,
-        msg: dict[str, Any],
-    ) -> None:
-        """WebSocket command handler for generate_token."""
-        await handle_generate_token(hass_inner, connection, msg)
-
-    @websocket_command({"type": WS_TYPE_UPDATE_SCREENSHOT})
-    @async_response
-    async def handle_update_screenshot_impl(
-        hass_inner: HomeAssistant,
-        connection: ActiveConnection,
-        msg: dict[str, Any],
-    ) -> None:
-        """WebSocket command handler for update_screenshot."""
-        await handle_update_screenshot(hass_inner, connection, msg)
+    for command in _WS_COMMANDS:
+        async_register_command(hass, command)
 
     _LOGGER.debug("WebSocket API setup complete")
 
@@ -100,43 +150,36 @@ async def handle_get_devices(
             }
         }
     """
+    msg_id = msg["id"]
+
     try:
         entry_id = msg.get("entry_id")
         if not entry_id:
-            connection.send_error(msg["id"], ERR_INVALID_FORMAT, "entry_id required")
+            connection.send_error(msg_id, ERR_INVALID_FORMAT, "entry_id required")
             return
 
         # Get coordinator for the entry
         coordinator = _get_coordinator(hass, entry_id)
         if not coordinator:
             connection.send_error(
-                msg["id"],
+                msg_id,
                 "unauthorized",
                 "No coordinator for this entry",
             )
             return
 
-        # Get devices
-        devices = []
-        for device_id, device in coordinator.devices.items():
-            devices.append(
-                {
-                    "id": device.id,
-                    "name": device.name,
-                    "device_type": device.device_type.value,
-                    "status": device.status.value if device.status else None,
-                    "battery_level": device.battery_level,
-                    "battery_low": device.battery_low,
-                    "firmware_version": device.firmware_version,
-                    "is_online": device.is_online,
-                    "last_seen": device.last_seen.isoformat()
-                    if device.last_seen
-                    else None,
-                }
-            )
+        # Serialize devices, adding the derived flags the frontend shows
+        devices = [
+            {
+                **device.to_dict(),
+                "battery_low": device.battery_low,
+                "is_online": device.is_online,
+            }
+            for device in coordinator.devices.values()
+        ]
 
         connection.send_result(
-            msg["id"],
+            msg_id,
             {
                 "devices": devices,
             },
@@ -145,7 +188,7 @@ async def handle_get_devices(
 
     except Exception as err:  # pylint: disable=broad-except
         _LOGGER.error("Error in get_devices handler: %s", err)
-        connection.send_error(msg["id"], "internal_error", str(err))
+        connection.send_error(msg_id, "internal_error", str(err))
 
 
 async def handle_generate_token(
@@ -177,13 +220,15 @@ async def handle_generate_token(
             }
         }
     """
+    msg_id = msg["id"]
+
     try:
         entry_id = msg.get("entry_id")
         device_id = msg.get("device_id")
 
         if not entry_id or not device_id:
             connection.send_error(
-                msg["id"],
+                msg_id,
                 ERR_INVALID_FORMAT,
                 "entry_id and device_id required",
             )
@@ -193,17 +238,17 @@ async def handle_generate_token(
         coordinator = _get_coordinator(hass, entry_id)
         if not coordinator:
             connection.send_error(
-                msg["id"],
+                msg_id,
                 "unauthorized",
                 "No coordinator for this entry",
             )
             return
 
         # Get token manager
-        token_manager = _get_token_manager(hass, entry_id, coordinator)
+        token_manager = _get_token_manager(hass, entry_id)
         if not token_manager:
             connection.send_error(
-                msg["id"],
+                msg_id,
                 "internal_error",
                 "No token manager for this entry",
             )
@@ -214,7 +259,7 @@ async def handle_generate_token(
         token_info = token_manager.get_token_info(token)
 
         connection.send_result(
-            msg["id"],
+            msg_id,
             {
                 "token": token,
                 "expires_at": token_info.get("expires_at"),
@@ -224,10 +269,10 @@ async def handle_generate_token(
 
     except ValueError as err:
         _LOGGER.warning("Invalid token generation request: %s", err)
-        connection.send_error(msg["id"], ERR_INVALID_FORMAT, str(err))
+        connection.send_error(msg_id, ERR_INVALID_FORMAT, str(err))
     except Exception as err:  # pylint: disable=broad-except
         _LOGGER.error("Error in generate_token handler: %s", err)
-        connection.send_error(msg["id"], "internal_error", str(err))
+        connection.send_error(msg_id, "internal_error", str(err))
 
 
 async def handle_update_screenshot(
@@ -262,6 +307,8 @@ async def handle_update_screenshot(
             }
         }
     """
+    msg_id = msg["id"]
+
     try:
         entry_id = msg.get("entry_id")
         device_id = msg.get("device_id")
@@ -270,7 +317,7 @@ async def handle_update_screenshot(
 
         if not all([entry_id, device_id, image_url, token]):
             connection.send_error(
-                msg["id"],
+                msg_id,
                 ERR_INVALID_FORMAT,
                 "entry_id, device_id, image_url, and token required",
             )
@@ -280,88 +327,85 @@ async def handle_update_screenshot(
         coordinator = _get_coordinator(hass, entry_id)
         if not coordinator:
             connection.send_error(
-                msg["id"],
+                msg_id,
                 "unauthorized",
                 "No coordinator for this entry",
             )
             return
 
         # Get token manager and validate token
-        token_manager = _get_token_manager(hass, entry_id, coordinator)
+        token_manager = _get_token_manager(hass, entry_id)
         if not token_manager:
             connection.send_error(
-                msg["id"],
+                msg_id,
                 "internal_error",
                 "No token manager for this entry",
             )
             return
 
-        try:
-            # Validate token signature and expiration
-            token_manager.validate_token(token)
-            token_info = token_manager.get_token_info(token)
-
-            # Ensure token is for the requested device
-            if token_info.get("device_id") != device_id:
-                _LOGGER.warning(
-                    "Token device mismatch: token is for %s, request is for %s",
-                    token_info.get("device_id"),
-                    device_id,
-                )
-                connection.send_error(
-                    msg["id"],
-                    "unauthorized",
-                    "Token is not valid for this device",
-                )
-                return
-
-        except InvalidTokenError as err:
-            _LOGGER.warning("Invalid token in screenshot update: %s", err)
-            connection.send_error(msg["id"], "unauthorized", str(err))
-            return
+        # Validate token signature and expiration
+        token_manager.validate_token(token)
+        token_info = token_manager.get_token_info(token)
 
-        # Update screenshot
-        try:
-            success = await coordinator.async_update_screenshot(
-                device_id=device_id,
-                image_url=image_url,
-                token=token,
+        # Ensure token is for the requested device
+        if token_info.get("device_id") != device_id:
+            _LOGGER.warning(
+                "Token device mismatch: token is for %s, request is for %s",
+                token_info.get("device_id"),
+                device_id,
             )
-
-            if success:
-                connection.send_result(
-                    msg["id"],
-                    {
-                        "success": True,
-                        "message": "Screenshot updated successfully",
-                    },
-                )
-                _LOGGER.info(
-                    "Screenshot updated for device %s via WebSocket", device_id
-                )
-            else:
-                connection.send_result(
-                    msg["id"],
-                    {
-                        "success": False,
-                        "message": "Failed to update screenshot",
-                    },
-                )
-                _LOGGER.warning("Screenshot update failed for device %s", device_id)
-
-        except TRMNLAPIError as err:
-            _LOGGER.error("API error updating screenshot: %s", err)
-            connection.send_result(
-                msg["id"],
-                {
-                    "success": False,
-                    "message": f"API error: {err}",
-                },
+            connection.send_error(
+                msg_id,
+                "unauthorized",
+                "Token is not valid for this device",
             )
+            return
 
+        # Update screenshot
+        success = await coordinator.async_update_screenshot(
+            device_id=device_id,
+            image_url=image_url,
+            token=token,
+        )
+
+    # InvalidTokenError subclasses TRMNLAPIError, so it must be caught first
+    except InvalidTokenError as err:
+        _LOGGER.warning("Invalid token in screenshot update: %s", err)
+        connection.send_error(msg_id, "unauthorized", str(err))
+        return
+    except TRMNLAPIError as err:
+        _LOGGER.error("API error updating screenshot: %s", err)
+        connection.send_result(
+            msg_id,
+            {
+                "success": False,
+                "message": f"API error: {err}",
+            },
+        )
+        return
     except Exception as err:  # pylint: disable=broad-except
         _LOGGER.error("Error in update_screenshot handler: %s", err)
-        connection.send_error(msg["id"], "internal_error", str(err))
+        connection.send_error(msg_id, "internal_error", str(err))
+        return
+
+    if success:
+        connection.send_result(
+            msg_id,
+            {
+                "success": True,
+                "message": "Screenshot updated successfully",
+            },
+        )
+        _LOGGER.debug("Screenshot updated for device %s via WebSocket", device_id)
+    else:
+        connection.send_result(
+            msg_id,
+            {
+                "success": False,
+                "message": "Failed to update screenshot",
+            },
+        )
+        _LOGGER.warning("Screenshot update failed for device %s", device_id)
 
 
 def _get_coordinator(hass: HomeAssistant, entry_id: str) -> TRMNLCoordinator | None:
@@ -374,47 +418,25 @@ def _get_coordinator(hass: HomeAssistant, entry_id: str) -> TRMNLCoordinator | N
     Returns:
         Coordinator instance or None if not found
     """
-    try:
-        entry_data = hass.data.get(DOMAIN, {}).get(entry_id, {})
-        return entry_data.get("coordinator")
-    except (KeyError, AttributeError):
+    entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
+    if entry_data is None:
         return None
+    return entry_data["coordinator"]
 
 
-def _get_token_manager(
-    hass: HomeAssistant, entry_id: str, coordinator: TRMNLCoordinator
-) -> TokenManager | None:
+def _get_token_manager(hass: HomeAssistant, entry_id: str) -> TokenManager | None:
     """Get the token manager for a config entry.
 
-    Creates a new TokenManager if one doesn't exist yet.
+    The manager is created at entry setup when the entry has a token secret.
 
     Args:
         hass: Home Assistant instance
         entry_id: Config entry ID
-        coordinator: Coordinator instance
 
     Returns:
-        TokenManager instance or None if token secret not found
+        TokenManager instance or None if the entry has no token secret
     """
-    try:
-        # Check if token manager already exists
-        entry_data = hass.data.get(DOMAIN, {}).get(entry_id, {})
-        if "token_manager" in entry_data:
-            return entry_data["token_manager"]
-
-        # Get token secret from config entry
-        config_entry = hass.config_entries.async_get_entry(entry_id)
-        if not config_entry:
-            return None
-
-        token_secret = config_entry.data.get(CONF_TOKEN_SECRET)
-        if not token_secret:
-            return None
-
-        # Create and cache token manager
-        token_manager = TokenManager(token_secret)
-        hass.data[DOMAIN][entry_id]["token_manager"] = token_manager
-        return token_manager
-
-    except (KeyError, AttributeError, ValueError):
+    entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
+    if entry_data is None:
         return None
+    return entry_data.get("token_manager")